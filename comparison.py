@@ -1,4 +1,6 @@
 import matplotlib.pyplot as plt
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from metaheuristic_algorithms import (
     LionOptimizationLB,
     BatAlgorithm,
@@ -6,75 +8,80 @@ from metaheuristic_algorithms import (
     MonarchButterflyOptimization
 )
 
+try:
+    plt.style.use('seaborn-v0_8')
+except:
+    plt.style.use('ggplot')
+
+# Reused across calls; cleared before each plot
+_FIG = None
+
 def plot_comparison(results, num_nodes, num_tasks, filename_suffix=""):
     """Plot comparison graphs for the results"""
-    try:
-        plt.style.use('seaborn-v0_8')
-    except:
-        plt.style.use('ggplot')
-    
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+    global _FIG
+    if _FIG is None:
+        _FIG = plt.figure(figsize=(16, 12))
+    fig = _FIG
+    fig.clear()
+    axes = fig.subplots(2, 2).ravel()
     fig.suptitle(f"Load Balancing Algorithm Comparison\n({num_nodes} Nodes, {num_tasks} Tasks)", 
                 y=1.02, fontsize=14)
     
     colors = ['#4C72B0', '#55A868', '#C44E52', '#8172B2']
     algorithms = list(results.keys())
+    metrics = ['avg_response_time', 'throughput', 'fault_tolerance', 'energy_consumption']
+    data = np.array([[res[m] for m in metrics] for res in results.values()], dtype=float)
     
-    # Response Time Comparison
-    bars1 = ax1.bar(algorithms, [res['avg_response_time'] for res in results.values()], color=colors)
-    ax1.set_title("Response Time (seconds)\nLower is better", pad=15)
-    ax1.set_ylabel("Seconds")
-    ax1.set_ylim(0, 1.2)
-    ax1.bar_label(bars1, fmt='%.2f', padding=3, fontsize=9)
-    ax1.tick_params(axis='x', rotation=45)
-    
-    # Throughput Comparison
-    bars2 = ax2.bar(algorithms, [res['throughput'] for res in results.values()], color=colors)
-    ax2.set_title("Throughput (% tasks completed)\nHigher is better", pad=15)
-    ax2.set_ylabel("Percentage")
-    ax2.set_ylim(0, 110)
-    ax2.bar_label(bars2, fmt='%.1f%%', padding=3, fontsize=9)
-    ax2.tick_params(axis='x', rotation=45)
+    # (title, y-axis label, y-limit, bar label format) per metric
+    panels = [
+        ("Response Time (seconds)\nLower is better", "Seconds", (0, 1.2), '%.2f'),
+        ("Throughput (% tasks completed)\nHigher is better", "Percentage", (0, 110), '%.1f%%'),
+        ("Fault Tolerance (% recovered)\nHigher is better", "Percentage", (0, 110), '%.1f%%'),
+        ("Energy Consumption (kWh)\nLower is better", "Kilowatt-hours", None, '%.1f'),
+    ]
     
-    # Fault Tolerance Comparison
-    bars3 = ax3.bar(algorithms, [res['fault_tolerance'] for res in results.values()], color=colors)
-    ax3.set_title("Fault Tolerance (% recovered)\nHigher is better", pad=15)
-    ax3.set_ylabel("Percentage")
-    ax3.set_ylim(0, 110)
-    ax3.bar_label(bars3, fmt='%.1f%%', padding=3, fontsize=9)
-    ax3.tick_params(axis='x', rotation=45)
+    for col, (ax, (title, ylabel, ylim, fmt)) in enumerate(zip(axes, panels)):
+        bars = ax.bar(algorithms, data[:, col], color=colors)
+        ax.set_title(title, pad=15)
+        ax.set_ylabel(ylabel)
+        if ylim is not None:
+            ax.set_ylim(*ylim)
+        ax.bar_label(bars, fmt=fmt, padding=3, fontsize=9)
+        ax.tick_params(axis='x', rotation=45)
     
-    # Energy Consumption Comparison
-    bars4 = ax4.bar(algorithms, [res['energy_consumption'] for res in results.values()], color=colors)
-    ax4.set_title("Energy Consumption (kWh)\nLower is better", pad=15)
-    ax4.set_ylabel("Kilowatt-hours")
-    ax4.bar_label(bars4, fmt='%.1f', padding=3, fontsize=9)
-    ax4.tick_params(axis='x', rotation=45)
-    
-    plt.tight_layout()
+    fig.tight_layout()
     output_filename = f"algorithm_comparison_{filename_suffix}.png" if filename_suffix else "algorithm_comparison.png"
-    plt.savefig(output_filename, dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.savefig(output_filename, dpi=300, bbox_inches='tight')
     
     return output_filename
 
-def run_comparison(num_nodes=60, num_tasks=1000):
-    """Run comparison with 4 algorithms"""
+def _run_one(algo_class, num_nodes, num_tasks):
+    """Build and run one algorithm; executed in a worker process"""
+    return algo_class(num_nodes, num_tasks).run()
+
+def run_comparison(num_nodes=60, num_tasks=1000, plot=True):
+    """Run comparison with 4 algorithms; returns the per-algorithm metrics"""
     algorithms = {
-        "Lion Optimization": LionOptimizationLB(num_nodes, num_tasks),
-        "Bat Algorithm": BatAlgorithm(num_nodes, num_tasks),
-        "Crow Search": CrowSearchAlgorithm(num_nodes, num_tasks),
-        "Monarch Butterfly": MonarchButterflyOptimization(num_nodes, num_tasks)
+        "Lion Optimization": LionOptimizationLB,
+        "Bat Algorithm": BatAlgorithm,
+        "Crow Search": CrowSearchAlgorithm,
+        "Monarch Butterfly": MonarchButterflyOptimization
     }
     
     print(f"\nRunning performance comparison with {num_nodes} nodes and {num_tasks} tasks...")
     results = {}
     
-    for name, algo in algorithms.items():
-        print(f"\nExecuting {name}...")
+    # The simulations share no state, so each runs on its own core
+    with ProcessPoolExecutor(max_workers=len(algorithms)) as executor:
+        futures = {}
+        for name, algo_class in algorithms.items():
+            print(f"Executing {name}...")
+            futures[name] = executor.submit(_run_one, algo_class, num_nodes, num_tasks)
+    
+    for name, future in futures.items():
         try:
-            results[name] = algo.run()
-            print(f"{name} results:")
+            results[name] = future.result()
+            print(f"\n{name} results:")
             print(f"- Avg Response Time: {results[name]['avg_response_time']:.2f}s")
             print(f"- Throughput: {results[name]['throughput']:.1f}%")
             print(f"- Fault Tolerance: {results[name]['fault_tolerance']:.1f}%")
@@ -93,9 +100,10 @@ def run_comparison(num_nodes=60, num_tasks=1000):
             }
     
     # Generate graphs
-    suffix = f"{num_nodes}n_{num_tasks}t"
-    graph_filename = plot_comparison(results, num_nodes, num_tasks, suffix)
-    print(f"\nComparison graphs saved to '{graph_filename}'")
+    if plot:
+        suffix = f"{num_nodes}n_{num_tasks}t"
+        graph_filename = plot_comparison(results, num_nodes, num_tasks, suffix)
+        print(f"\nComparison graphs saved to '{graph_filename}'")
     
     # Print summary table
     print("\nPerformance Summary:")
@@ -105,6 +113,7 @@ def run_comparison(num_nodes=60, num_tasks=1000):
         print(f"{name:<20} | {res['avg_response_time']:>9.2f} | {res['throughput']:>9.1f}% | "
               f"{res['fault_tolerance']:>6.1f}% | {res['energy_consumption']:>11.2f} | "
               f"{res['completed_tasks']:>4}/{num_tasks}")
+    return results
 
 if __name__ == "__main__":
     # First run with paper's parameters
@@ -8,6 +8,9 @@ class LionOptimizationLB:
         self.max_iter = max_iter
         self.nodes = self.initialize_nodes()
         self.tasks = self.generate_tasks()
+        self.task_mips = np.array([task['mips_required'] for task in self.tasks])
+        # Node each task currently runs on, -1 if unassigned
+        self.assignment = np.full(num_tasks, -1, dtype=np.int32)
         
     def initialize_nodes(self):
         """Initialize cloud nodes with random capacities"""
@@ -22,8 +25,7 @@ class LionOptimizationLB:
                 'pe': pe,
                 'mips': mips,
                 'capacity': capacity,
-                'current_load': 0,
-                'tasks': []
+                'current_load': 0
             })
         return nodes
     
@@ -84,14 +86,14 @@ class LionOptimizationLB:
         # Check if best node can handle the task
         if (best_node['current_load'] + task['mips_required']) <= best_node['capacity']:
             best_node['current_load'] += task['mips_required']
-            best_node['tasks'].append(task['id'])
+            self.assignment[task['id']] = best_node['id']
             return best_node['id']
         else:
             # If best node is overloaded, try neighbors (migration)
             for neighbor in [left_neighbor, right_neighbor]:
                 if neighbor and (neighbor['current_load'] + task['mips_required']) <= neighbor['capacity']:
                     neighbor['current_load'] += task['mips_required']
-                    neighbor['tasks'].append(task['id'])
+                    self.assignment[task['id']] = neighbor['id']
                     # Update positions (simulating hunting behavior)
                     self.update_node_positions(best_node, left_neighbor, right_neighbor)
                     return neighbor['id']
@@ -99,6 +101,58 @@ class LionOptimizationLB:
         # If no suitable node found, return -1 (shouldn't happen with proper load balancing)
         return -1
     
+    def migrate_tasks(self, failed_node_idx):
+        """Move a failed node's tasks onto the fittest other nodes in vectorized passes"""
+        task_ids = np.flatnonzero(self.assignment == failed_node_idx)
+        if task_ids.size == 0:
+            return 0
+        mips = self.task_mips[task_ids]
+        load = np.array([node['current_load'] for node in self.nodes], dtype=float)
+        capacity = np.array([node['capacity'] for node in self.nodes], dtype=float)
+
+        # Candidates in descending fitness order, failed node excluded
+        fitness = (1 - load / capacity) * 100
+        order = np.argsort(-fitness, kind='stable')
+        order = order[order != failed_node_idx]
+        if order.size == 0:
+            # No other node to take them: the tasks are lost
+            self.assignment[task_ids] = -1
+            return 0
+        free = capacity[order] - load[order]
+
+        # Greedy fill in fitness order: lay the tasks end to end over the
+        # nodes' free capacity and give each task the node its span falls in.
+        # Tasks straddling two nodes are retried against what is left.
+        targets = np.full(len(mips), -1)
+        pending = np.arange(len(mips))
+        while pending.size:
+            ends = np.cumsum(mips[pending])
+            bounds = np.concatenate(([0], np.cumsum(free)))
+            slot = np.searchsorted(bounds[1:], ends)
+            fits = slot < free.size
+            fits[fits] = ends[fits] - mips[pending[fits]] >= bounds[slot[fits]]
+            if not fits.any():
+                # Only straddlers left: first-fit the next one to keep progressing
+                k = pending[0]
+                room = free >= mips[k]
+                if room.any():
+                    targets[k] = j = room.argmax()
+                    free[j] -= mips[k]
+                pending = pending[1:]
+                continue
+            targets[pending[fits]] = slot[fits]
+            free -= np.bincount(slot[fits], weights=mips[pending[fits]], minlength=free.size)
+            pending = pending[~fits]
+
+        placed = targets >= 0
+        new_nodes = order[targets[placed]]
+        self.assignment[task_ids] = -1
+        self.assignment[task_ids[placed]] = new_nodes
+        np.add.at(load, new_nodes, mips[placed])
+        for i in np.unique(new_nodes):
+            self.nodes[i]['current_load'] = load[i]
+        return int(placed.sum())
+
     def run_optimization(self):
         """Run the Lion Optimization load balancing algorithm"""
         allocation_results = []
@@ -115,12 +169,8 @@ class LionOptimizationLB:
                 failed_node_idx = random.randint(0, self.num_nodes - 1)
                 print(f"Node {failed_node_idx} failed! Migrating tasks...")
                 # Migrate tasks from failed node to others
-                for t in self.nodes[failed_node_idx]['tasks']:
-                    reallocated_node = self.allocate_task(self.tasks[t])
-                    if reallocated_node != -1:
-                        migration_count += 1
+                migration_count += self.migrate_tasks(failed_node_idx)
                 self.nodes[failed_node_idx]['current_load'] = 0
-                self.nodes[failed_node_idx]['tasks'] = []
         
         return allocation_results, migration_count
     
@@ -132,8 +182,10 @@ class LionOptimizationLB:
         total_utilized = sum(node['current_load'] for node in self.nodes)
         
         # Simplified response time calculation
+        assigned = self.assignment[self.assignment >= 0]
+        has_tasks = np.bincount(assigned, minlength=self.num_nodes) > 0
         for node in self.nodes:
-            if node['tasks']:
+            if has_tasks[node['id']]:
                 rt = (node['current_load'] / node['capacity']) * 0.5  # Scaling factor
                 response_times.append(rt)
         
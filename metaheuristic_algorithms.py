@@ -1,224 +1,511 @@
 import numpy as np
-import random
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from numba import njit
+
+@dataclass
+class Nodes:
+    """Structure-of-arrays view of the simulated VMs"""
+    mips: np.ndarray
+    capacity: np.ndarray
+    inv_capacity: np.ndarray
+    current_load: np.ndarray
+    failed: np.ndarray
+    energy_coefficient: np.ndarray
+
+@dataclass
+class Tasks:
+    """Structure-of-arrays view of the cloudlet workload"""
+    length: np.ndarray
+    mips_required: np.ndarray
+    priority: np.ndarray
+
+@njit(cache=True)
+def _try_place(capacity, load, idx, mips):
+    """Add load to node idx in place if it stays within capacity"""
+    if (load[idx] + mips) <= capacity[idx]:
+        load[idx] += mips
+        return True
+    return False
+
+# Active nodes are kept in an indexed binary min-heap keyed by utilization,
+# passed around as heap = (order, pos, key): order[p] is the node in slot p,
+# pos[i] the slot of node i (-1 if never inserted) and key[i] its utilization.
+# Failed nodes are re-keyed to +inf so they sink out of the way.
+
+@njit(cache=True)
+def _heap_less(key, a, b):
+    """Heap order: lower utilization first, ties broken by node index"""
+    return key[a] < key[b] or (key[a] == key[b] and a < b)
+
+@njit(cache=True)
+def _sift_down(heap, p):
+    """Restore heap order below slot p after its key increased"""
+    order, pos, key = heap
+    n = order.shape[0]
+    while True:
+        c = 2 * p + 1
+        if c >= n:
+            break
+        if c + 1 < n and _heap_less(key, order[c + 1], order[c]):
+            c += 1
+        if not _heap_less(key, order[c], order[p]):
+            break
+        order[p], order[c] = order[c], order[p]
+        pos[order[p]] = p
+        pos[order[c]] = c
+        p = c
+
+@njit(cache=True)
+def _sift_up(heap, p):
+    """Restore heap order above slot p after its key decreased"""
+    order, pos, key = heap
+    while p > 0:
+        parent = (p - 1) // 2
+        if not _heap_less(key, order[p], order[parent]):
+            break
+        order[p], order[parent] = order[parent], order[p]
+        pos[order[p]] = p
+        pos[order[parent]] = parent
+        p = parent
+
+@njit(cache=True)
+def _build_heap(inv_capacity, load, active_idx):
+    """Indexed min-heap of the active nodes keyed by utilization"""
+    order = active_idx.copy()
+    key = load * inv_capacity
+    pos = np.full(inv_capacity.shape[0], -1, dtype=np.int32)
+    for p in range(order.shape[0]):
+        pos[order[p]] = p
+    heap = (order, pos, key)
+    for p in range(order.shape[0] // 2 - 1, -1, -1):
+        _sift_down(heap, p)
+    return heap
+
+@njit(cache=True)
+def _heap_update(inv_capacity, load, heap, idx):
+    """Re-key node idx after its load changed; removed nodes stay at +inf"""
+    order, pos, key = heap
+    if pos[idx] < 0 or key[idx] == np.inf:
+        return
+    old = key[idx]
+    key[idx] = load[idx] * inv_capacity[idx]
+    if key[idx] < old:
+        _sift_up(heap, pos[idx])
+    else:
+        _sift_down(heap, pos[idx])
+
+@njit(cache=True)
+def _heap_remove(heap, idx):
+    """Drop a failed node to the bottom of the heap"""
+    order, pos, key = heap
+    if pos[idx] < 0:
+        return
+    key[idx] = np.inf
+    _sift_down(heap, pos[idx])
+
+@njit(cache=True)
+def _heap_min(heap):
+    """Least-loaded active node, or -1 if none is left"""
+    order, pos, key = heap
+    if order.shape[0] == 0 or key[order[0]] == np.inf:
+        return -1
+    return order[0]
+
+@njit(cache=True)
+def _heap_min_except(heap, skip):
+    """Least-loaded active node other than skip, or -1"""
+    order, pos, key = heap
+    best = -1
+    # The runner-up of a binary heap sits in one of the root's children
+    for p in range(min(3, order.shape[0])):
+        i = order[p]
+        if i != skip and key[i] != np.inf and (best < 0 or _heap_less(key, i, best)):
+            best = i
+    return best
+
+# Every algorithm provides one allocation kernel with a shared calling convention:
+#   allocate_<algo>(capacity, inv_capacity, load, failed, active_idx, heap,
+#                   mips, state, r_alloc, r_pick)
+# It places one task, keeps the heap in sync with every load it changes and
+# returns the chosen node index or -1. active_idx lists the active nodes in
+# index order; state is an algorithm-specific tuple of parameters and arrays.
+
+@njit(cache=True)
+def _seed_kernel_rng(seed):
+    """Seed the random stream used inside compiled kernels"""
+    np.random.seed(seed)
+
+@njit(cache=True)
+def hunt_lion(capacity, inv_capacity, load, failed, heap, mips, state, r_hunt):
+    """Pride hunting over territories; returns the chosen node index or -1
+
+    Territory t owns node indices territory_nodes[territory_ptr[t]:territory_ptr[t + 1]].
+    """
+    territory_nodes, territory_ptr, best_fitness, best_node = state[0], state[1], state[2], state[3]
+    active = state[6]
+    for t in range(territory_ptr.shape[0] - 1):
+        n_active = 0
+        for i in territory_nodes[territory_ptr[t]:territory_ptr[t + 1]]:
+            if not failed[i]:
+                active[n_active] = i
+                n_active += 1
+        if n_active < 2:
+            continue
+
+        if r_hunt[t] < 0.7:  # 70% exploitation probability
+            num_hunters = max(2, n_active // 2)
+            # Partial Fisher-Yates: the first num_hunters slots become the sample
+            best = -1
+            for j in range(num_hunters):
+                s = j + int(np.random.random() * (n_active - j))
+                h = active[s]
+                active[s] = active[j]
+                active[j] = h
+                if best < 0 or load[h] * inv_capacity[h] < load[best] * inv_capacity[best]:
+                    best = h
+            if _try_place(capacity, load, best, mips):
+                _heap_update(inv_capacity, load, heap, best)
+                # Update territory best
+                current_fit = (load[best] * inv_capacity[best]) * 100
+                if current_fit < best_fitness[t]:
+                    best_fitness[t] = current_fit
+                    best_node[t] = best
+                return best
+    return -1
+
+@njit(cache=True)
+def _nomad_lion(capacity, inv_capacity, load, failed, heap, mips, state):
+    """Nomad migration with load checks; returns the recipient node or -1"""
+    nomads, migration_threshold = state[4], state[5]
+    if nomads[0] < 0:
+        # Most loaded active nodes become nomads
+        active = np.flatnonzero(~failed)
+        if active.shape[0] == 0:
+            return -1
+        fitness = (load[active] * inv_capacity[active]) * 100
+        order = np.argsort(-fitness, kind='mergesort')
+        k = min(nomads.shape[0], active.shape[0])
+        nomads[:k] = active[order[:k]]
+
+    for nomad in nomads:
+        if nomad < 0:
+            break
+        if failed[nomad]:
+            continue
+        if load[nomad] > capacity[nomad] * migration_threshold:
+            recipient = _heap_min_except(heap, nomad)
+            if recipient < 0:
+                continue
+
+            migratable = min(load[nomad] * 0.3, mips, capacity[recipient] - load[recipient])
+            if migratable > 0:
+                load[nomad] -= migratable
+                load[recipient] += migratable
+                _heap_update(inv_capacity, load, heap, nomad)
+                _heap_update(inv_capacity, load, heap, recipient)
+                return recipient
+    return -1
+
+@njit(cache=True)
+def allocate_lion(capacity, inv_capacity, load, failed, active_idx, heap, mips, state, r_hunt, r_pick):
+    """Three-phase allocation with fallbacks"""
+    # Phase 1: Pride hunting
+    node = hunt_lion(capacity, inv_capacity, load, failed, heap, mips, state, r_hunt)
+    if node >= 0:
+        return node
+
+    # Phase 2: Nomad migration
+    node = _nomad_lion(capacity, inv_capacity, load, failed, heap, mips, state)
+    if node >= 0:
+        return node
+
+    # Phase 3: Global fallback
+    node = _heap_min(heap)
+    if node >= 0 and _try_place(capacity, load, node, mips):
+        _heap_update(inv_capacity, load, heap, node)
+        return node
+    return -1
+
+@njit(cache=True)
+def allocate_bat(capacity, inv_capacity, load, failed, active_idx, heap, mips, state, r_pulse, r_pick):
+    """Bat echolocation step; returns the chosen node index or -1"""
+    pulse_rate = state[0]
+    best = _heap_min(heap)
+    if best < 0:
+        return -1
+
+    node = -1
+    if r_pulse > pulse_rate:
+        candidate = active_idx[int(r_pick * active_idx.shape[0])]
+        if _try_place(capacity, load, candidate, mips):
+            node = candidate
+    if node < 0 and _try_place(capacity, load, best, mips):
+        node = best
+    if node >= 0:
+        _heap_update(inv_capacity, load, heap, node)
+    return node
+
+@njit(cache=True)
+def allocate_crow(capacity, inv_capacity, load, failed, active_idx, heap, mips, state, r_alloc, r_pick):
+    """Crow step; returns the chosen node index or -1
+
+    A crow's memory of each node is its live load, so the best remembered
+    node is simply the least-loaded active one.
+    """
+    best_memory = _heap_min(heap)
+    if best_memory >= 0 and _try_place(capacity, load, best_memory, mips):
+        _heap_update(inv_capacity, load, heap, best_memory)
+        return best_memory
+    return -1
+
+@njit(cache=True)
+def allocate_mbo(capacity, inv_capacity, load, failed, active_idx, heap, mips, state, r_op, r_pick):
+    """Monarch butterfly step; returns the chosen node index or -1"""
+    bar = state[0]
+    if active_idx.shape[0] == 0:
+        return -1
+    if r_op < bar / (bar + 1):
+        # Migration operator: move work to the least-loaded node
+        node = _heap_min(heap)
+    else:
+        # Adjustment operator
+        node = active_idx[int(r_pick * active_idx.shape[0])]
+    if _try_place(capacity, load, node, mips):
+        _heap_update(inv_capacity, load, heap, node)
+        return node
+    return -1
+
+@njit(cache=True)
+def _simulate_failure(failed, active_idx, r_pick, r_fail, fault_probability, min_nodes):
+    """Safe failure simulation with limits; returns the failed node or -1"""
+    if active_idx.shape[0] <= min_nodes:
+        return -1
+
+    # Only allow up to 10% of nodes to fail
+    max_failures = max(1, int(failed.shape[0] * 0.1))
+    if failed.shape[0] - active_idx.shape[0] >= max_failures:
+        return -1
+
+    # Select a random active node to fail
+    idx = active_idx[int(r_pick * active_idx.shape[0])]
+    if r_fail < fault_probability:
+        failed[idx] = True
+        return idx
+    return -1
+
+# One driver per algorithm runs the whole task loop, failures included, in a
+# single nopython call and returns (completed, active_idx). Drivers capture
+# only the algorithm id and reference the allocation kernels as globals, so
+# numba's on-disk cache keeps one entry per algorithm.
+#
+# A failed node's workload is not re-allocated on its own: it rides along
+# with the next task, so a successful migration costs no extra scan of the
+# nodes. If the combined placement fails, the task is retried alone and only
+# the carried workload is lost; the failed node keeps its load.
+
+LION, BAT, CROW, MBO = 0, 1, 2, 3
+_RUN_KERNELS = {}
+
+def make_run_kernel(algo):
+    """Simulation driver for one algorithm"""
+    if algo in _RUN_KERNELS:
+        return _RUN_KERNELS[algo]
+    # A compile-time constant, so the untaken allocation branches are pruned
+    ALGO = algo
+
+    @njit(cache=True)
+    def run_kernel(capacity, inv_capacity, load, failed, task_mips, state, r_alloc, r_pick,
+                   r_check, r_fail_pick, r_fail, fault_probability, min_nodes):
+        active_idx = np.flatnonzero(~failed).astype(np.int32)
+        heap = _build_heap(inv_capacity, load, active_idx)
+        completed = 0
+        carry = 0.0
+        carry_node = -1
+        for k in range(task_mips.shape[0]):
+            mips = task_mips[k] + carry
+            migrated = carry_node >= 0
+            while True:
+                if ALGO == LION:
+                    node = allocate_lion(capacity, inv_capacity, load, failed, active_idx, heap,
+                                         mips, state, r_alloc[k], r_pick[k])
+                elif ALGO == BAT:
+                    node = allocate_bat(capacity, inv_capacity, load, failed, active_idx, heap,
+                                        mips, state, r_alloc[k], r_pick[k])
+                elif ALGO == CROW:
+                    node = allocate_crow(capacity, inv_capacity, load, failed, active_idx, heap,
+                                         mips, state, r_alloc[k], r_pick[k])
+                else:
+                    node = allocate_mbo(capacity, inv_capacity, load, failed, active_idx, heap,
+                                        mips, state, r_alloc[k], r_pick[k])
+                if node >= 0 or not migrated:
+                    break
+                # The combined placement failed: place the task on its own
+                migrated = False
+                mips = task_mips[k]
+            if node >= 0:
+                completed += 1
+            if migrated:
+                load[carry_node] = 0
+            elif carry_node >= 0:
+                # If couldn't migrate, count as lost workload
+                completed -= int(carry / 1000)
+            carry = 0.0
+            carry_node = -1
+
+            # Periodically check for failures: 10% chance per task
+            if r_check[k] < 0.1:
+                idx = _simulate_failure(failed, active_idx, r_fail_pick[k], r_fail[k],
+                                        fault_probability, min_nodes)
+                if idx >= 0:
+                    active_idx = active_idx[active_idx != idx]
+                    _heap_remove(heap, idx)
+                    if load[idx] > 0:
+                        carry = load[idx]
+                        carry_node = idx
+
+        if carry_node >= 0:
+            # Failed on the last task, with nothing left to carry the workload
+            completed -= int(carry / 1000)
+        return completed, active_idx
+
+    _RUN_KERNELS[algo] = run_kernel
+    return run_kernel
 
 class MetaheuristicAlgorithm(ABC):
     """Base class for all metaheuristic load balancing algorithms"""
     def __init__(self, num_nodes, num_tasks):
         self.num_nodes = num_nodes
         self.num_tasks = num_tasks
+        self._rng = np.random.default_rng()
         self.nodes = self.initialize_nodes()
         self.tasks = self.generate_tasks()
+        # Uniform draws for every per-task stochastic decision, generated up front
+        self._r_alloc = self._rng.random(self._alloc_draw_shape(), dtype=np.float32)
+        self._r_pick = self._rng.random(num_tasks, dtype=np.float32)
+        self._r_check = self._rng.random(num_tasks, dtype=np.float32)
+        self._r_fail_pick = self._rng.random(num_tasks, dtype=np.float32)
+        self._r_fail = self._rng.random(num_tasks, dtype=np.float32)
+        # Rebuilt only when a node fails
+        self.active_indices = np.arange(num_nodes, dtype=np.int32)
         self.fault_probability = 0.05
         self.min_nodes_for_operation = 3
         self.completed_tasks = 0
+        # Bound by run() on first use, once subclass parameters are set
+        self._run_kernel = None
 
     def initialize_nodes(self):
         """Initialize VMs with realistic parameters"""
-        return [{
-            'id': i,
-            'pe': 4,
-            'mips': random.randint(2000, 4000),
-            'capacity': 4 * random.randint(2000, 4000),
-            'current_load': 0,
-            'failed': False,
-            'energy_coefficient': random.uniform(0.001, 0.003)
-        } for i in range(self.num_nodes)]
+        n, rng = self.num_nodes, self._rng
+        # Capacity is at least 4 * 2000, so its reciprocal is always finite
+        capacity = (4 * rng.integers(2000, 4001, size=n)).astype(np.float32)
+        return Nodes(
+            mips=rng.integers(2000, 4001, size=n).astype(np.float32),
+            capacity=capacity,
+            inv_capacity=(1.0 / capacity).astype(np.float32),
+            current_load=np.zeros(n, dtype=np.float32),
+            failed=np.zeros(n, dtype=np.bool_),
+            energy_coefficient=rng.uniform(0.001, 0.003, size=n).astype(np.float32)
+        )
 
     def generate_tasks(self):
         """Generate realistic cloud tasks"""
-        return [{
-            'id': i,
-            'length': random.randint(200, 4000),
-            'pe': 1,
-            'mips_required': random.randint(200, 4000),
-            'priority': random.choice([1, 2, 3])
-        } for i in range(self.num_tasks)]
+        n, rng = self.num_tasks, self._rng
+        return Tasks(
+            length=rng.integers(200, 4001, size=n, dtype=np.int32),
+            mips_required=rng.integers(200, 4001, size=n, dtype=np.int32),
+            priority=rng.integers(1, 4, size=n, dtype=np.int8)
+        )
+
+    def _alloc_draw_shape(self):
+        """Shape of the per-task allocation draws"""
+        return self.num_tasks
 
     @abstractmethod
-    def allocate_task(self, task):
+    def _make_kernel(self):
+        """Return (run_kernel, state) for this algorithm"""
         pass
 
-    def simulate_failure(self):
-        """Safe failure simulation with limits"""
-        active_nodes = [n for n in self.nodes if not n['failed']]
-        if len(active_nodes) <= self.min_nodes_for_operation:
-            return
-
-        # Only allow up to 10% of nodes to fail
-        max_failures = max(1, int(self.num_nodes * 0.1))
-        current_failures = sum(1 for n in self.nodes if n['failed'])
-        
-        if current_failures >= max_failures:
-            return
-
-        # Select a random active node to fail
-        node = random.choice(active_nodes)
-        if random.random() < self.fault_probability:
-            node['failed'] = True
-            if node['current_load'] > 0:
-                # Create a new task representing the failed workload
-                temp_task = {
-                    'id': -1,  # Special ID for migrated tasks
-                    'mips_required': node['current_load'],
-                    'length': node['current_load'],  # Approximate length
-                    'pe': 1,
-                    'priority': 1
-                }
-                if self.allocate_task(temp_task):
-                    node['current_load'] = 0
-                else:
-                    # If couldn't migrate, count as lost workload
-                    self.completed_tasks -= int(node['current_load'] / 1000)
-
     def run(self):
         """Execute simulation with safety checks"""
-        self.completed_tasks = 0
-        
-        for task in self.tasks:
-            if self.allocate_task(task):
-                self.completed_tasks += 1
-            
-            # Periodically check for failures
-            if random.random() < 0.1:  # 10% chance per task
-                self.simulate_failure()
-        
+        if self._run_kernel is None:
+            self._run_kernel, self._state = self._make_kernel()
+        nodes = self.nodes
+        self.completed_tasks, self.active_indices = self._run_kernel(
+            nodes.capacity, nodes.inv_capacity, nodes.current_load, nodes.failed,
+            self.tasks.mips_required, self._state,
+            self._r_alloc, self._r_pick, self._r_check, self._r_fail_pick, self._r_fail,
+            self.fault_probability, self.min_nodes_for_operation
+        )
         return self.calculate_metrics()
 
     def calculate_metrics(self):
         """Calculate realistic metrics"""
-        active_nodes = [n for n in self.nodes if not n['failed']]
-        failed_nodes = [n for n in self.nodes if n['failed']]
-        
-        # Response Time Calculation
-        response_times = []
-        for node in active_nodes:
-            if node['capacity'] > 0:
-                utilization = min(1.0, node['current_load'] / node['capacity'])
-                # Base 100ms + scaled processing delay
-                response_time = 0.1 + (utilization * 0.9)
-                response_times.append(response_time)
-        
+        nodes = self.nodes
+        active = ~nodes.failed
+        failed = nodes.failed
+        load = nodes.current_load[active]
+
+        # Response Time Calculation: base 100ms + scaled processing delay
+        utilization = np.minimum(1.0, load * nodes.inv_capacity[active])
+        response_times = 0.1 + (utilization * 0.9)
+
         # Throughput Calculation
         throughput = (self.completed_tasks / self.num_tasks) * 100 if self.num_tasks > 0 else 0
-        
+
         # Fault Tolerance Calculation
-        recovered_nodes = sum(1 for n in failed_nodes if n['current_load'] == 0)
-        fault_tolerance = (recovered_nodes / len(failed_nodes)) * 100 if failed_nodes else 100
-        
+        num_failed = int(failed.sum())
+        recovered_nodes = int((failed & (nodes.current_load == 0)).sum())
+        fault_tolerance = (recovered_nodes / num_failed) * 100 if num_failed else 100
+
         # Energy Consumption
-        energy = sum(
-            n['current_load'] * n['energy_coefficient']
-            for n in active_nodes
-        )
-        
+        energy = float((load * nodes.energy_coefficient[active]).sum())
+
         return {
-            'avg_response_time': np.mean(response_times) if response_times else 0.5,
+            'avg_response_time': float(response_times.mean()) if response_times.size else 0.5,
             'throughput': min(100.0, throughput),  # Cap at 100%
             'fault_tolerance': min(100.0, fault_tolerance),  # Cap at 100%
             'energy_consumption': energy,
-            'active_nodes': len(active_nodes),
+            'active_nodes': int(active.sum()),
             'completed_tasks': self.completed_tasks
         }
 
 class LionOptimizationLB(MetaheuristicAlgorithm):
     def __init__(self, num_nodes, num_tasks):
-        super().__init__(num_nodes, num_tasks)
+        # Territories size the allocation draws made by the base class
+        self.num_nodes = num_nodes
         self.pride_size = max(5, num_nodes // 4)
         self.territories = self._initialize_territories()
-        self.nomads = []
+        super().__init__(num_nodes, num_tasks)
+        self._territory_nodes = np.concatenate([t['idx'] for t in self.territories])
+        self._territory_ptr = np.cumsum([0] + [len(t['idx']) for t in self.territories], dtype=np.int32)
+        self.territory_best_fitness = np.full(len(self.territories), np.inf, dtype=np.float32)
+        self.territory_best_node = np.full(len(self.territories), -1, dtype=np.int32)
+        # Filled with the most loaded nodes on the first nomad phase
+        self.nomads = np.full(max(2, num_nodes // 10), -1, dtype=np.int32)
         self.migration_threshold = 0.8
+        # Scratch space for hunter sampling, sized to the largest territory
+        self._hunter_buf = np.empty(int(np.diff(self._territory_ptr).max()), dtype=np.int32)
+        _seed_kernel_rng(int(self._rng.integers(2**31)))
 
     def _initialize_territories(self):
         """Divide nodes into prides with safety checks"""
         territories = []
         for i in range(0, self.num_nodes, self.pride_size):
-            territory_nodes = self.nodes[i:i+self.pride_size]
-            if len(territory_nodes) >= 2:
-                territories.append({
-                    'nodes': territory_nodes,
-                    'best_fitness': float('inf'),
-                    'best_node': None
-                })
-        return territories or [{'nodes': self.nodes, 'best_fitness': float('inf'), 'best_node': None}]
-
-    def _calculate_fitness(self, node):
-        """Fitness function with failure check"""
-        if node['failed'] or node['capacity'] <= 0:
-            return float('inf')
-        return (node['current_load'] / node['capacity']) * 100
-
-    def _hunting_phase(self, task):
-        """Coordinated hunting with population checks"""
-        for territory in self.territories:
-            active_nodes = [n for n in territory['nodes'] if not n['failed'] and n['capacity'] > 0]
-            if len(active_nodes) < 2:
-                continue
-                
-            if random.random() < 0.7:  # 70% exploitation probability
-                num_hunters = max(2, min(len(active_nodes)//2, len(active_nodes)))
-                hunters = random.sample(active_nodes, num_hunters)
-                best_hunter = min(hunters, key=self._calculate_fitness)
-                
-                if (best_hunter['current_load'] + task['mips_required']) <= best_hunter['capacity']:
-                    best_hunter['current_load'] += task['mips_required']
-                    # Update territory best
-                    current_fit = self._calculate_fitness(best_hunter)
-                    if current_fit < territory['best_fitness']:
-                        territory['best_fitness'] = current_fit
-                        territory['best_node'] = best_hunter
-                    return True
-        return False
-
-    def _nomad_phase(self, task):
-        """Nomad migration with load checks"""
-        if not self.nomads:
-            active_nodes = [n for n in self.nodes if not n['failed'] and n['capacity'] > 0]
-            if not active_nodes:
-                return False
-            self.nomads = sorted(
-                active_nodes,
-                key=self._calculate_fitness,
-                reverse=True
-            )[:max(2, self.num_nodes//10)]
-        
-        for nomad in self.nomads:
-            if nomad['current_load'] > nomad['capacity'] * self.migration_threshold:
-                active_nodes = [n for n in self.nodes if not n['failed'] and n['capacity'] > 0 and n != nomad]
-                if not active_nodes:
-                    continue
-                    
-                recipient = min(active_nodes, key=self._calculate_fitness)
-                migratable = min(
-                    nomad['current_load'] * 0.3,
-                    task['mips_required'],
-                    recipient['capacity'] - recipient['current_load']
-                )
-                if migratable > 0:
-                    nomad['current_load'] -= migratable
-                    recipient['current_load'] += migratable
-                    return True
-        return False
-
-    def allocate_task(self, task):
-        """Three-phase allocation with fallbacks"""
-        # Phase 1: Pride hunting
-        if self._hunting_phase(task):
-            return True
-        
-        # Phase 2: Nomad migration
-        if self._nomad_phase(task):
-            return True
-        
-        # Phase 3: Global fallback
-        active_nodes = [n for n in self.nodes if not n['failed'] and n['capacity'] > 0]
-        if active_nodes:
-            best_global = min(active_nodes, key=self._calculate_fitness)
-            if (best_global['current_load'] + task['mips_required']) <= best_global['capacity']:
-                best_global['current_load'] += task['mips_required']
-                return True
-        
-        return False
+            territory_idx = np.arange(i, min(i + self.pride_size, self.num_nodes), dtype=np.int32)
+            if len(territory_idx) >= 2:
+                territories.append({'idx': territory_idx})
+        return territories or [{'idx': np.arange(self.num_nodes, dtype=np.int32)}]
+
+    def _alloc_draw_shape(self):
+        # Hunting draws one exploitation roll per territory for each task
+        return (self.num_tasks, len(self.territories))
+
+    def _make_kernel(self):
+        state = (self._territory_nodes, self._territory_ptr, self.territory_best_fitness,
+                 self.territory_best_node, self.nomads, self.migration_threshold,
+                 self._hunter_buf)
+        return make_run_kernel(LION), state
 
 class BatAlgorithm(MetaheuristicAlgorithm):
     def __init__(self, num_nodes, num_tasks):
@@ -226,80 +513,21 @@ class BatAlgorithm(MetaheuristicAlgorithm):
         self.loudness = 0.5
         self.pulse_rate = 0.5
 
-    def allocate_task(self, task):
-        active_nodes = [n for n in self.nodes if not n['failed'] and n['capacity'] > 0]
-        if not active_nodes:
-            return False
-            
-        best_node = min(active_nodes, key=lambda n: n['current_load'] / n['capacity'])
-        
-        if random.random() > self.pulse_rate:
-            candidate = random.choice(active_nodes)
-            if (candidate['current_load'] + task['mips_required']) <= candidate['capacity']:
-                candidate['current_load'] += task['mips_required']
-                return True
-        
-        if (best_node['current_load'] + task['mips_required']) <= best_node['capacity']:
-            best_node['current_load'] += task['mips_required']
-            return True
-        
-        return False
+    def _make_kernel(self):
+        return make_run_kernel(BAT), (self.pulse_rate,)
 
 class CrowSearchAlgorithm(MetaheuristicAlgorithm):
     def __init__(self, num_nodes, num_tasks):
         super().__init__(num_nodes, num_tasks)
-        self.memory = [None] * num_nodes
         self.flight_length = 0.1
 
-    def allocate_task(self, task):
-        active_nodes = [n for n in self.nodes if not n['failed'] and n['capacity'] > 0]
-        if not active_nodes:
-            return False
-            
-        # Initialize memory if empty
-        if not any(self.memory):
-            self.memory = [{'node': n, 'load': n['current_load']} for n in active_nodes]
-        
-        # Update memory with current loads
-        for i, node in enumerate(self.nodes):
-            if node in active_nodes and self.memory[i]:
-                self.memory[i]['load'] = node['current_load']
-        
-        # Find best node in memory
-        valid_memories = [m for m in self.memory if m and not m['node']['failed'] and m['node']['capacity'] > 0]
-        if not valid_memories:
-            return False
-            
-        best_memory = min(valid_memories, key=lambda m: m['load'] / m['node']['capacity'])
-        
-        if (best_memory['node']['current_load'] + task['mips_required']) <= best_memory['node']['capacity']:
-            best_memory['node']['current_load'] += task['mips_required']
-            return True
-        
-        return False
+    def _make_kernel(self):
+        return make_run_kernel(CROW), (self.flight_length,)
 
 class MonarchButterflyOptimization(MetaheuristicAlgorithm):
     def __init__(self, num_nodes, num_tasks):
         super().__init__(num_nodes, num_tasks)
         self.bar = 5.0
 
-    def allocate_task(self, task):
-        active_nodes = [n for n in self.nodes if not n['failed'] and n['capacity'] > 0]
-        if not active_nodes:
-            return False
-            
-        if random.random() < self.bar / (self.bar + 1):
-            # Migration operator
-            src = max(active_nodes, key=lambda n: n['current_load'] / n['capacity'])
-            dst = min(active_nodes, key=lambda n: n['current_load'] / n['capacity'])
-            if (dst['current_load'] + task['mips_required']) <= dst['capacity']:
-                dst['current_load'] += task['mips_required']
-                return True
-        else:
-            # Adjustment operator
-            node = random.choice(active_nodes)
-            if (node['current_load'] + task['mips_required']) <= node['capacity']:
-                node['current_load'] += task['mips_required']
-                return True
-        
-        return False
\ No newline at end of file
+    def _make_kernel(self):
+        return make_run_kernel(MBO), (self.bar,)